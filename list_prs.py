@@ -12,6 +12,7 @@ main 브랜치로 향하는 PR들을 조회하여 현황을 보여줍니다.
 - 프론트엔드(FE)와 백엔드(BE) 레포지토리 분리 표시
 - 머지 방향 표시 (main ← source_branch)
 - 총 개수 요약 제공
+- 조회 결과를 ~/.cache/list_prs에 5분간 캐시 (--no-cache로 무시)
 
 사용법:
     python3 list_prs.py
@@ -35,7 +36,10 @@ main 브랜치로 향하는 PR들을 조회하여 현황을 보여줍니다.
 import subprocess
 import json
 from datetime import datetime, timedelta
+from pathlib import Path
+import os
 import sys
+import time
 import argparse
 import io
 
@@ -105,42 +109,106 @@ def get_last_friday():
     last_friday = today - timedelta(days=days_since_friday)
     return last_friday.strftime('%Y-%m-%d')
 
-def run_gh_command(repo, state='open'):
-    """GitHub CLI로 PR 목록 조회"""
+# 조직 전체 PR을 검색하는 GraphQL 쿼리 (gh --paginate가 $endCursor로 100개 단위 페이지를 이어 붙임)
+SEARCH_QUERY = """
+query($q: String!, $endCursor: String) {
+  search(type: ISSUE, query: $q, first: 100, after: $endCursor) {
+    pageInfo { hasNextPage endCursor }
+    nodes {
+      ... on PullRequest { number title headRefName state updatedAt repository { name } }
+    }
+  }
+}
+"""
+
+# 조회 결과 캐시 위치와 유효 시간(초)
+CACHE_DIR = Path.home() / '.cache' / 'list_prs'
+CACHE_TTL = 300
+
+def search_prs(search_query):
+    """GitHub GraphQL search API로 조직 전체 PR 조회 (실패 시 None 반환)"""
+    # 모든 페이지의 PR 노드를 한 줄에 하나씩 JSON으로 출력
+    cmd = ['gh', 'api', 'graphql', '--paginate',
+           '-f', f'query={SEARCH_QUERY}', '-f', f'q={search_query}',
+           '--jq', '.data.search.nodes[] | select(length > 0) | tojson']
+    # stdout은 bytes 그대로 json.loads에 전달 (str 디코딩 생략), 사용하지 않는 stderr는 버림
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    if result.returncode != 0:
+        return None
     try:
-        cmd = ['gh', 'pr', 'list', '-R', repo, '--base', 'main', '--state', state, '--limit', '50', '--json', 'number,title,headRefName,state,updatedAt']
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return json.loads(result.stdout)
-    except subprocess.CalledProcessError:
-        return []
+        return [json.loads(line) for line in result.stdout.splitlines() if line]
     except json.JSONDecodeError:
-        return []
-
-def is_after_date(pr_date, cutoff_date):
-    """PR 날짜가 기준 날짜 이후인지 확인"""
-    pr_datetime = datetime.fromisoformat(pr_date.replace('Z', '+00:00'))
-    cutoff_datetime = datetime.strptime(cutoff_date, '%Y-%m-%d')
-    return pr_datetime.date() >= cutoff_datetime.date()
-
-def get_team_repos():
-    """팀 레포지토리 목록 생성"""
-    repos = []
-
-    # FE 레포지토리들
-    for i in range(1, 23):
-        if i == 17:
-            repos.append(('TEAM17_FE', 'FE'))
-        else:
-            repos.append((f'Team{i}_FE', 'FE'))
+        return None
+
+def cached_search_prs(search_query, cache_path, use_cache=True):
+    """search_prs 결과를 디스크에 캐시하여 CACHE_TTL 이내 재실행 시 재사용 (조회 실패 시 None 반환)
 
-    # BE 레포지토리들
-    for i in range(1, 23):
-        if i == 17:
-            repos.append(('TEAM17_BE', 'BE'))
+    캐시 파일은 하나만 두고 덮어쓰며, 저장된 검색 쿼리(기준 날짜 포함)가 같을 때만 재사용합니다.
+    """
+    if use_cache:
+        try:
+            if time.time() - cache_path.stat().st_mtime < CACHE_TTL:
+                cached = json.loads(cache_path.read_bytes())
+                if cached['query'] == search_query:
+                    return cached['nodes']
+        except (OSError, json.JSONDecodeError, KeyError, TypeError):
+            pass
+
+    nodes = search_prs(search_query)
+    if nodes is None:
+        # 조회 실패 결과는 캐시하지 않음
+        return None
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        cached = {'query': search_query, 'nodes': nodes}
+        tmp_path.write_bytes(json.dumps(cached, ensure_ascii=False).encode('utf-8'))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return nodes
+
+def collect_prs(last_friday, use_cache=True):
+    """OPEN/MERGED PR을 한 번에 조회하여 레포 이름별 {'open': [...], 'merged': [...]}로 묶어 반환
+
+    레포 이름 키는 casefold()로 정규화합니다 (gh pr list -R처럼 대소문자 무시).
+
+    상태 구분 없이 검색한 뒤 OPEN/MERGED만 로컬에서 분류합니다 (CLOSED는 제외).
+    조회에 실패하면 None을 반환합니다.
+    """
+    # 기준 시각(UTC) 이후 갱신된 PR만 서버에서 필터링
+    cutoff_iso = f'{last_friday}T00:00:00Z'
+    query = f'org:kakao-tech-campus-3rd-step3 is:pr base:main updated:>={cutoff_iso} sort:updated-desc'
+    cache_path = CACHE_DIR / 'search.json'
+    prs = cached_search_prs(query, cache_path, use_cache)
+    if prs is None:
+        return None
+
+    pr_data = {}
+    for pr in prs:
+        if pr['state'] == 'OPEN':
+            state = 'open'
+        elif pr['state'] == 'MERGED':
+            state = 'merged'
         else:
-            repos.append((f'Team{i}_BE', 'BE'))
+            continue
+        repo_prs = pr_data.setdefault(pr['repository']['name'].casefold(), {'open': [], 'merged': []})
+        repo_prs[state].append(pr)
+    return pr_data
 
-    return repos
+def _team_repo_names(suffix):
+    """팀 1-22의 레포지토리 이름 목록 생성 (17팀은 대문자 TEAM 접두어 사용)"""
+    return tuple('TEAM17_' + suffix if i == 17 else f'Team{i}_{suffix}' for i in range(1, 23))
+
+# 팀 레포지토리 목록 (모듈 로드 시 한 번만 생성)
+FE_REPOS = _team_repo_names('FE')
+BE_REPOS = _team_repo_names('BE')
+
+def write_lines(lines):
+    """여러 줄을 한 번의 write 호출로 출력"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 def check_claude_cli():
     """Claude CLI 설치 여부 확인"""
@@ -206,6 +274,8 @@ def main():
     parser = argparse.ArgumentParser(description='카카오테크캠퍼스 3기 Step3 PR 현황 조회')
     parser.add_argument('--analyze', '-a', action='store_true',
                        help='Claude AI를 사용하여 PR 현황 분석 (Claude CLI 필요)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help=f'캐시된 조회 결과({CACHE_TTL}초 이내)를 무시하고 새로 조회')
     args = parser.parse_args()
 
     # GitHub CLI 설정 확인
@@ -215,132 +285,84 @@ def main():
     last_friday = get_last_friday()
     current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-    # 출력 캡처를 위한 리스트
+    # 출력 캡처를 위한 리스트 (print 대신 모아서 한 번에 출력)
     output_lines = []
 
     header = "=" * 60
     title = "카카오테크캠퍼스 3기 Step3 PR 현황 (main 브랜치)"
     period = f"조회 기간: {last_friday} ~ {current_time}"
 
-    print(header)
-    print(title)
-    print(period)
-    print(header)
-    print()
-
-    # 출력 캡처
+    # 헤더는 PR 조회 전에 먼저 출력
     output_lines.extend([header, title, period, header, ""])
+    write_lines(output_lines)
+    report_start = len(output_lines)
+
+    # 조직 전체 PR을 GraphQL 검색으로 한 번에 조회
+    pr_data = collect_prs(last_friday, use_cache=not args.no_cache)
+    if pr_data is None:
+        # 빈 결과로 보고서를 만들면 모든 팀이 미제출로 보이므로 여기서 중단
+        print("❌ PR 조회 중 오류가 발생했습니다.")
+        print("\n다음을 확인해주세요:")
+        print("  1. 네트워크 연결 상태")
+        print("  2. GitHub CLI 인증 만료 여부: gh auth status --hostname github.com")
+        print("  3. GitHub 검색 API 요청 한도 초과 여부 (잠시 후 다시 실행)")
+        sys.exit(1)
+
+    # FE/BE 섹션별 출력 순서
+    sections = (("### 프론트엔드 (FE)", FE_REPOS), ("\n### 백엔드 (BE)", BE_REPOS))
+    no_prs = {'open': [], 'merged': []}
 
-    open_count = 0
-    merged_count = 0
     open_prs_by_team = {}
     merged_prs_by_team = {}
 
-    # OPEN 상태 PR 조회
-    print("🔵 OPEN 상태 PR")
-    print("-" * 50)
-
-    print("### 프론트엔드 (FE)")
-    for repo_name, repo_type in get_team_repos():
-        if repo_type != 'FE':
-            continue
+    # OPEN 상태 PR
+    output_lines.append("🔵 OPEN 상태 PR")
+    output_lines.append("-" * 50)
 
-        full_repo = f"kakao-tech-campus-3rd-step3/{repo_name}"
-        prs = run_gh_command(full_repo, 'open')
+    for section_title, repos in sections:
+        output_lines.append(section_title)
+        for repo_name in repos:
+            prs = pr_data.get(repo_name.casefold(), no_prs)['open']
+            for pr in prs:
+                output_lines.append(f"  {repo_name} - #{pr['number']}: {pr['title']} (main ← {pr['headRefName']}) [OPEN]")
 
-        team_pr_count = 0
-        for pr in prs:
-            if is_after_date(pr['updatedAt'], last_friday):
-                print(f"  {repo_name} - #{pr['number']}: {pr['title']} (main ← {pr['headRefName']}) [OPEN]")
-                open_count += 1
-                team_pr_count += 1
+            if prs:
+                open_prs_by_team[repo_name] = len(prs)
 
-        if team_pr_count > 0:
-            open_prs_by_team[repo_name] = team_pr_count
+    # MERGED 상태 PR
+    output_lines.append(f"\n🟢 MERGED 상태 PR ({last_friday} 이후)")
+    output_lines.append("-" * 50)
 
-    print("\n### 백엔드 (BE)")
-    for repo_name, repo_type in get_team_repos():
-        if repo_type != 'BE':
-            continue
+    for section_title, repos in sections:
+        output_lines.append(section_title)
+        for repo_name in repos:
+            prs = pr_data.get(repo_name.casefold(), no_prs)['merged']
+            for pr in prs:
+                merge_date = pr['updatedAt'][:10]  # ISO 8601(UTC) 문자열의 날짜 부분
+                output_lines.append(f"  {repo_name} - #{pr['number']}: {pr['title']} (main ← {pr['headRefName']}) ✅ MERGED ({merge_date})")
 
-        full_repo = f"kakao-tech-campus-3rd-step3/{repo_name}"
-        prs = run_gh_command(full_repo, 'open')
+            if prs:
+                merged_prs_by_team[repo_name] = len(prs)
 
-        team_pr_count = 0
-        for pr in prs:
-            if is_after_date(pr['updatedAt'], last_friday):
-                print(f"  {repo_name} - #{pr['number']}: {pr['title']} (main ← {pr['headRefName']}) [OPEN]")
-                open_count += 1
-                team_pr_count += 1
-
-        if team_pr_count > 0:
-            open_prs_by_team[repo_name] = team_pr_count
-
-    # MERGED 상태 PR 조회
-    print(f"\n🟢 MERGED 상태 PR ({last_friday} 이후)")
-    print("-" * 50)
-
-    print("### 프론트엔드 (FE)")
-    for repo_name, repo_type in get_team_repos():
-        if repo_type != 'FE':
-            continue
-
-        full_repo = f"kakao-tech-campus-3rd-step3/{repo_name}"
-        prs = run_gh_command(full_repo, 'merged')
-
-        team_merged_count = 0
-        for pr in prs:
-            if is_after_date(pr['updatedAt'], last_friday):
-                merge_date = datetime.fromisoformat(pr['updatedAt'].replace('Z', '+00:00')).strftime('%Y-%m-%d')
-                print(f"  {repo_name} - #{pr['number']}: {pr['title']} (main ← {pr['headRefName']}) ✅ MERGED ({merge_date})")
-                merged_count += 1
-                team_merged_count += 1
-
-        if team_merged_count > 0:
-            merged_prs_by_team[repo_name] = team_merged_count
-
-    print("\n### 백엔드 (BE)")
-    for repo_name, repo_type in get_team_repos():
-        if repo_type != 'BE':
-            continue
-
-        full_repo = f"kakao-tech-campus-3rd-step3/{repo_name}"
-        prs = run_gh_command(full_repo, 'merged')
-
-        team_merged_count = 0
-        for pr in prs:
-            if is_after_date(pr['updatedAt'], last_friday):
-                merge_date = datetime.fromisoformat(pr['updatedAt'].replace('Z', '+00:00')).strftime('%Y-%m-%d')
-                print(f"  {repo_name} - #{pr['number']}: {pr['title']} (main ← {pr['headRefName']}) ✅ MERGED ({merge_date})")
-                merged_count += 1
-                team_merged_count += 1
-
-        if team_merged_count > 0:
-            merged_prs_by_team[repo_name] = team_merged_count
+    open_count = sum(open_prs_by_team.values())
+    merged_count = sum(merged_prs_by_team.values())
 
     # 요약
-    print()
-    print("=" * 60)
-    print("📊 요약")
-    print("-" * 50)
-    print(f"OPEN 상태 PR: {open_count}개")
-    print(f"MERGED 상태 PR: {merged_count}개")
-    print(f"총 PR: {open_count + merged_count}개")
-    print("=" * 60)
+    output_lines.append("")
+    output_lines.append("=" * 60)
+    output_lines.append("📊 요약")
+    output_lines.append("-" * 50)
+    output_lines.append(f"OPEN 상태 PR: {open_count}개")
+    output_lines.append(f"MERGED 상태 PR: {merged_count}개")
+    output_lines.append(f"총 PR: {open_count + merged_count}개")
+    output_lines.append("=" * 60)
+
+    write_lines(output_lines[report_start:])
 
     # 분석 기능 실행
     if args.analyze:
-        # 출력을 다시 실행하는 대신, 기본 출력을 subprocess로 캡처
-        try:
-            result = subprocess.run([sys.executable, __file__],
-                                  capture_output=True, text=True, encoding='utf-8')
-            if result.returncode == 0:
-                analyze_with_claude(result.stdout)
-            else:
-                print("❌ PR 데이터 수집 중 오류가 발생했습니다.")
-                print(f"오류: {result.stderr}")
-        except Exception as e:
-            print(f"❌ 분석 준비 중 오류가 발생했습니다: {str(e)}")
+        # 스크립트를 다시 실행하지 않고 이미 캡처한 출력을 그대로 전달
+        analyze_with_claude('\n'.join(output_lines))
 
 if __name__ == "__main__":
     main()